@@ -958,10 +958,6 @@ def _init_ssh_profile(cfg,
 
     snapshots_path.mkdir(parents=True)
 
-    # use a tmp-file for flock because test_flockExclusive would deadlock
-    # otherwise if a regular snapshot is running in background
-    snapshots.Snapshots.GLOBAL_FLOCK = generic.TMP_FLOCK.name
-
     # The snapshot instance
     return snapshots.Snapshots(cfg)
 
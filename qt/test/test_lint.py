@@ -37,7 +37,7 @@ class MirrorMirrorOnTheWall(unittest.TestCase):
         path = path.parent
 
         # Find recursive all py-files.
-        return path.rglob('**/*.py')
+        return path.rglob('*.py')
 
     @unittest.skipUnless(ON_TRAVIS or PYLINT_AVIALBE, PYLINT_REASON)
     def test_with_pylint(self):